@@ -21,10 +21,10 @@ Now new methods are accessible to Pandas dataframes as ".check":
 All public .check methods display the result but then return the unchanged DataFrame, so a method chain continues unbroken.
 """
 
+import os
 from datetime import datetime, timedelta
-from typing import Any, Callable, List, Type, Union
+from typing import Any, Callable, Dict, List, Type, Union
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from pandas.core.groupby.groupby import DataError
 
@@ -42,13 +42,40 @@ from .options import (
     set_format,
     set_mode,
 )
-from .run_checks import _apply_modifications, _check_data
+from .run_checks import (
+    _apply_modifications,
+    _check_data,
+    _identity,
+    _select_subset,
+)
 from .timer import print_time_elapsed
-from .utils import _has_nulls, _is_type, _lambda_to_string
+from .utils import (
+    _count_duplicates,
+    _count_rows_with_nulls,
+    _estimate_memory_usage,
+    _has_nulls,
+    _is_type,
+    _lambda_to_string,
+)
+
+# Functions to export data in each file format supported by .check.write()
+_WRITERS: Dict[str, Callable[..., None]] = {
+    "csv": lambda data, path, **kwargs: data.to_csv(path, **kwargs),
+    "excel": lambda data, path, **kwargs: data.to_excel(path, **kwargs),
+    "feather": lambda data, path, **kwargs: data.to_feather(path, **kwargs),
+    "parquet": lambda data, path, **kwargs: data.to_parquet(path, **kwargs),
+    "pickle": lambda data, path, **kwargs: data.to_pickle(path, **kwargs),
+    "tsv": lambda data, path, **kwargs: data.to_csv(path, sep="\t", **kwargs),
+}
+
+# Other names for file formats, including file extensions
+_FORMAT_ALIASES = {"pkl": "pickle", "xls": "excel", "xlsx": "excel"}
 
 
 @pd.api.extensions.register_dataframe_accessor("check")
 class DataFrameChecks:
+    __slots__ = ("_obj",)  # No per-instance __dict__
+
     def __init__(self, pandas_obj: Union[pd.DataFrame, pd.Series]) -> None:
         self._obj = pandas_obj
 
@@ -84,9 +111,14 @@ class DataFrameChecks:
             raise TypeError(
                 f"Expected condition to be a lambda function (callable type) but received type {type(condition)}"
             )
-        data = self._obj[subset] if subset else self._obj
+        data = _select_subset(self._obj, subset)
         result = condition(data)
-        condition_str = _lambda_to_string(condition)
+        # Only look up the condition's source if we'll display it
+        condition_str = (
+            _lambda_to_string(condition)
+            if message_shows_condition and (not result or verbose)
+            else ""
+        )
 
         # Fail
         if not result:
@@ -364,7 +396,7 @@ class DataFrameChecks:
 
         if assert_not_null:
             if _has_nulls(
-                data=self._obj[subset] if subset else self._obj,
+                data=_select_subset(self._obj, subset),
                 fail_message=fail_message,
                 raise_exception=raise_exception,
                 exception_to_raise=exception_to_raise,
@@ -480,7 +512,7 @@ class DataFrameChecks:
         """
         if assert_not_null:
             if _has_nulls(
-                data=self._obj[subset] if subset else self._obj,
+                data=_select_subset(self._obj, subset),
                 fail_message=fail_message,
                 raise_exception=raise_exception,
                 exception_to_raise=exception_to_raise,
@@ -602,7 +634,9 @@ class DataFrameChecks:
         ):  # Single multiindex, like in brain_networks.csv test case
             subset = [subset]
 
-        found_dtypes = ", ".join([t.name for t in self._obj[subset].dtypes.values])
+        found_dtypes = ", ".join(
+            [t.name for t in _select_subset(self._obj, subset).dtypes.values]
+        )
         if not fail_message:
             dtype_clean = (
                 str(dtype).replace("<class", "").replace(">", "").replace("'", "")
@@ -659,7 +693,7 @@ class DataFrameChecks:
 
     def columns(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "🏛️ Columns",
     ) -> pd.DataFrame:
@@ -679,12 +713,13 @@ class DataFrameChecks:
             modify_fn=fn,
             subset=subset,
             check_name=check_name,
+            cache_key="columns",
         )
         return self._obj
 
     def describe(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "📏 Distributions",
         **kwargs: Any,
@@ -708,6 +743,7 @@ class DataFrameChecks:
             modify_fn=fn,
             subset=subset,
             check_name=check_name,
+            cache_key=("describe", tuple(sorted(kwargs.items()))),
         )
         return self._obj
 
@@ -725,7 +761,7 @@ class DataFrameChecks:
 
     def dtypes(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "🗂️ Data types",
     ) -> pd.DataFrame:
@@ -747,6 +783,7 @@ class DataFrameChecks:
             modify_fn=fn,
             subset=subset,
             check_name=check_name,
+            cache_key="dtypes",
         )
         return self._obj
 
@@ -764,7 +801,7 @@ class DataFrameChecks:
 
     def function(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
     ) -> pd.DataFrame:
@@ -802,7 +839,7 @@ class DataFrameChecks:
     def head(
         self,
         n: int = 5,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
     ) -> pd.DataFrame:
@@ -821,17 +858,17 @@ class DataFrameChecks:
         """
         _check_data(
             self._obj,
-            check_fn=lambda df: df.head(n),
+            check_fn=lambda df: df.iloc[:n],
             modify_fn=fn,
             subset=subset,
-            check_name=check_name if check_name else f"⬆️ First {n} rows",
+            check_name=check_name or (lambda: f"⬆️ First {n} rows"),
         )
         return self._obj
 
     def hist(
         self,
-        fn: Callable = lambda df: df,
-        subset: Union[str, List, None] = [],
+        fn: Callable = _identity,
+        subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
         **kwargs: Any,
     ) -> pd.DataFrame:
@@ -860,7 +897,7 @@ class DataFrameChecks:
                 check_name
                 if check_name
                 else "📏 Distribution"
-                if subset and len(subset) == 1
+                if isinstance(subset, str) or (subset and len(subset) == 1)
                 else "📏 Distributions"
             )
             _ = _apply_modifications(self._obj, fn, subset).hist(**kwargs)
@@ -869,7 +906,7 @@ class DataFrameChecks:
 
     def info(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "ℹ️ Info",
         **kwargs: Any,
@@ -895,7 +932,7 @@ class DataFrameChecks:
 
     def memory_usage(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "💾 Memory usage",
         **kwargs: Any,
@@ -915,19 +952,30 @@ class DataFrameChecks:
 
         Note:
             Include argument `deep=True` to get further memory usage of object dtypes in the DataFrame. See Pandas docs for memory_usage() for more info.
+
+            For DataFrames with more columns than the option `pdchecks.wide_frame_threshold`, and without `deep=True`, memory usage is estimated by dtype rather than shown by column.
         """
         _check_data(
             self._obj,
-            check_fn=lambda df: df.memory_usage(**kwargs),
+            check_fn=lambda df: _estimate_memory_usage(df, kwargs.get("index", True))
+            if isinstance(df, pd.DataFrame)
+            and df.shape[1] > pd.get_option("pdchecks.wide_frame_threshold")
+            and not kwargs.get("deep")
+            else df.memory_usage(**kwargs),
             modify_fn=fn,
             subset=subset,
             check_name=check_name,
+            cache_key=(
+                "memory_usage",
+                tuple(sorted(kwargs.items())),
+                pd.get_option("pdchecks.wide_frame_threshold"),
+            ),
         )
         return self._obj
 
     def ncols(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "🏛️ Columns",
     ) -> pd.DataFrame:
@@ -947,12 +995,13 @@ class DataFrameChecks:
             modify_fn=fn,
             subset=subset,
             check_name=check_name,
+            cache_key="ncols",
         )
         return self._obj
 
     def ndups(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
         **kwargs: Any,
@@ -972,20 +1021,22 @@ class DataFrameChecks:
         """
         _check_data(
             self._obj,
-            check_fn=lambda df: df.duplicated(**kwargs).sum(),
+            check_fn=lambda df: _count_duplicates(df, **kwargs),
             modify_fn=fn,
             subset=subset,
             check_name=check_name
-            if check_name
-            else f"👯‍♂️ Rows with duplication in {subset}"
-            if subset
-            else "👯‍♂️ Duplicated rows",
+            or (
+                lambda: f"👯‍♂️ Rows with duplication in {subset}"
+                if subset
+                else "👯‍♂️ Duplicated rows"
+            ),
+            cache_key=("ndups", tuple(sorted(kwargs.items()))),
         )
         return self._obj
 
     def nnulls(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         by_column: bool = True,
         check_name: Union[str, None] = "👻 Rows with NaNs",
@@ -1007,7 +1058,7 @@ class DataFrameChecks:
             return self._obj
         data = _apply_modifications(self._obj, fn, subset)
         na_counts = (
-            data.isna().any(axis=1).sum()
+            _count_rows_with_nulls(data)
             if isinstance(data, pd.DataFrame) and not by_column
             else data.isna().sum()
             if not by_column
@@ -1032,7 +1083,7 @@ class DataFrameChecks:
 
     def nrows(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "☰ Rows",
     ) -> pd.DataFrame:
@@ -1052,13 +1103,14 @@ class DataFrameChecks:
             modify_fn=fn,
             subset=subset,
             check_name=check_name,
+            cache_key="nrows",
         )
         return self._obj
 
     def nunique(
         self,
         column: str,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         **kwargs: Any,
     ) -> pd.DataFrame:
@@ -1081,7 +1133,7 @@ class DataFrameChecks:
                 _apply_modifications(
                     self._obj, fn=fn, subset=column
                 ).check.nunique(  # Apply fn, then filter to `column`, pass to SeriesChecks.check.nunique()
-                    fn=lambda df: df,  # Identity function
+                    fn=_identity,
                     check_name=check_name,
                     **kwargs,
                 )
@@ -1090,7 +1142,7 @@ class DataFrameChecks:
 
     def plot(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "",
         **kwargs: Any,
@@ -1126,7 +1178,7 @@ class DataFrameChecks:
     def print(
         self,
         object: Any = None,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
         max_rows: int = 10,
@@ -1145,7 +1197,7 @@ class DataFrameChecks:
         """
         _check_data(
             object if object else self._obj,
-            check_fn=lambda data: data if object else data.head(max_rows),
+            check_fn=lambda data: data if object else data.iloc[:max_rows],
             modify_fn=fn,
             subset=subset,
             check_name=check_name,
@@ -1217,7 +1269,7 @@ class DataFrameChecks:
 
     def shape(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "📐 Shape",
     ) -> pd.DataFrame:
@@ -1242,13 +1294,57 @@ class DataFrameChecks:
             modify_fn=fn,
             subset=subset,
             check_name=check_name,
+            cache_key="shape",
+        )
+        return self._obj
+
+    def summary(
+        self,
+        fn: Callable = _identity,
+        subset: Union[str, List, None] = None,
+        check_name: Union[str, None] = "📋 Summary",
+    ) -> pd.DataFrame:
+        """Displays the DataFrame's shape, columns, data types, and memory usage together, without modifying the DataFrame itself.
+
+        Args:
+            fn: An optional lambda function to apply to the DataFrame before summarizing it. Example: `lambda df: df.shape[0]>10`. Applied before subset.
+            subset: An optional list of column names or a string name of one column to limit which columns are summarized. Applied after fn.
+            check_name: An optional name for the check, to be printed as preface to the result.
+
+        Returns:
+            The original DataFrame, unchanged.
+
+        Note:
+            Gives the same information as chaining .check.shape(), .check.columns(), .check.dtypes(), and .check.memory_usage(index=False), in one table. The shape, as (rows, columns), is shown in the table's top-left corner.
+        """
+
+        def _summarize(data: Union[pd.DataFrame, pd.Series]) -> pd.DataFrame:
+            if isinstance(data, pd.Series):
+                data = data.to_frame()
+            table = pd.DataFrame(
+                {
+                    "dtype": data.dtypes.astype(str).to_numpy(),
+                    "memory_usage": data.memory_usage(index=False).to_numpy(),
+                },
+                index=data.columns,
+            )
+            table.columns.name = str(data.shape)
+            return table
+
+        _check_data(
+            self._obj,
+            check_fn=_summarize,
+            modify_fn=fn,
+            subset=subset,
+            check_name=check_name,
+            cache_key="summary",
         )
         return self._obj
 
     def tail(
         self,
         n: int = 5,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
     ) -> pd.DataFrame:
@@ -1267,18 +1363,19 @@ class DataFrameChecks:
         """
         _check_data(
             self._obj,
-            check_fn=lambda df: df.tail(n),
+            check_fn=lambda df: df.iloc[-n:] if n else df.iloc[:0],
             modify_fn=fn,
             subset=subset,
-            check_name=check_name if check_name else f"⬇️ Last {n} rows",
+            check_name=check_name or (lambda: f"⬇️ Last {n} rows"),
         )
         return self._obj
 
     def unique(
         self,
         column: str,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
+        max_rows: Union[int, None] = 200,
     ) -> pd.DataFrame:
         """Displays the unique values in a column, without modifying the DataFrame itself.
 
@@ -1288,6 +1385,7 @@ class DataFrameChecks:
             column: Column to check for unique values.
             fn: An optional lambda function to apply to the DataFrame before calling Pandas unique(). Example: `lambda df: df.shape[0]>10`. Applied before subset.
             check_name: An optional name for the check, to be printed as preface to the result.
+            max_rows: Maximum number of unique values to show. If None, show all of them. If values are left out, the default check name says so.
 
         Returns:
             The original DataFrame, unchanged.
@@ -1301,8 +1399,9 @@ class DataFrameChecks:
                 _apply_modifications(
                     self._obj, fn=fn, subset=column
                 ).check.unique(  # Apply fn, then filter to `column`  # Use SeriesChecks method
-                    fn=lambda df: df,  # Identify function
+                    fn=_identity,
                     check_name=check_name,
+                    max_rows=max_rows,
                 )
             )
         return self._obj
@@ -1310,7 +1409,7 @@ class DataFrameChecks:
     def value_counts(
         self,
         column: str,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         max_rows: int = 10,
         check_name: Union[str, None] = None,
         **kwargs: Any,
@@ -1338,7 +1437,7 @@ class DataFrameChecks:
                     self._obj, fn=fn, subset=column
                 ).check.value_counts(  # Apply fn, then filter to `column``  # Use SeriesChecks method
                     max_rows=max_rows,
-                    fn=lambda df: df,  # Identity function
+                    fn=_identity,
                     check_name=check_name,
                     **kwargs,
                 )
@@ -1349,7 +1448,7 @@ class DataFrameChecks:
         self,
         path: str,
         format: Union[str, None] = None,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         verbose: bool = False,
         **kwargs: Any,
@@ -1377,28 +1476,19 @@ class DataFrameChecks:
 
         if not get_mode()["enable_checks"]:
             return self._obj
-        format_clean = format.lower().replace(".", "").strip() if format else None
-        data = _apply_modifications(self._obj, fn, subset)
-        if path.endswith(".csv") or format_clean == "csv":
-            data.to_csv(path, **kwargs)
-        elif path.endswith(".feather") or format_clean == "feather":
-            data.to_feather(path, **kwargs)
-        elif path.endswith(".parquet") or format_clean == "parquet":
-            data.to_parquet(path, **kwargs)
-        elif path.endswith(".pkl") or format_clean == "pickle":
-            data.to_pickle(path, **kwargs)
-        elif path.endswith(".tsv") or format_clean == "tsv":
-            data.to_csv(path, sep="\t", **kwargs)
-        elif (
-            path.endswith(".xls")
-            or path.endswith(".xlsx")
-            or format_clean in ["xlsx", "xls", "excel"]
-        ):
-            data.to_excel(path, **kwargs)
-        else:
+        format_clean = (
+            format.lower().replace(".", "").strip()
+            if format
+            else os.path.splitext(path)[1].lower().lstrip(".")
+        )
+        writer = _WRITERS.get(_FORMAT_ALIASES.get(format_clean, format_clean))
+        if writer is None:
             raise AttributeError(
-                f"Can't write data to file. Unknown file extension in: {path}. "
+                f"Can't write data to file. Unknown format: {format}. "
+                if format
+                else f"Can't write data to file. Unknown file extension in: {path}. "
             )
+        writer(_apply_modifications(self._obj, fn, subset), path, **kwargs)
         if verbose:
             _display_line(f"📦 Wrote file {path}")
         return self._obj
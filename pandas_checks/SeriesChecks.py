@@ -24,11 +24,10 @@ All public .check methods display the result but then return the unchanged Serie
 from datetime import datetime, timedelta
 from typing import Any, Callable, Type, Union
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from pandas.core.groupby.groupby import DataError
 
-from .display import _display_line, _display_table_title
+from .display import _display_check, _display_line, _display_table_title
 from .options import (
     disable_checks,
     enable_checks,
@@ -37,13 +36,15 @@ from .options import (
     set_format,
     set_mode,
 )
-from .run_checks import _apply_modifications, _check_data
+from .run_checks import _apply_modifications, _check_data, _identity
 from .timer import print_time_elapsed
-from .utils import _has_nulls, _is_type, _lambda_to_string
+from .utils import _downcast_counts, _has_nulls, _is_type, _lambda_to_string
 
 
 @pd.api.extensions.register_series_accessor("check")
 class SeriesChecks:
+    __slots__ = ("_obj",)  # No per-instance __dict__
+
     def __init__(self, pandas_obj: pd.Series) -> None:
         self._obj = pandas_obj
 
@@ -78,7 +79,12 @@ class SeriesChecks:
                 f"Expected condition to be a lambda function (callable type) but received type {type(condition)}"
             )
         result = condition(self._obj)
-        condition_str = _lambda_to_string(condition)
+        # Only look up the condition's source if we'll display it
+        condition_str = (
+            _lambda_to_string(condition)
+            if message_shows_condition and (not result or verbose)
+            else ""
+        )
 
         # Fail
         if not result:
@@ -611,7 +617,7 @@ class SeriesChecks:
 
     def describe(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "📏 Distribution",
         **kwargs: Any,
     ) -> pd.Series:
@@ -646,7 +652,7 @@ class SeriesChecks:
 
     def dtype(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "🗂️ Data type",
     ) -> pd.Series:
         """Displays the data type of a Series, without modifying the Series itself.
@@ -665,6 +671,7 @@ class SeriesChecks:
             check_fn=lambda s: s.dtype,
             modify_fn=fn,
             check_name=check_name,
+            cache_key="dtype",
         )
         return self._obj
 
@@ -682,7 +689,7 @@ class SeriesChecks:
 
     def function(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
     ) -> pd.Series:
         """Applies an arbitrary function on a Series and shows the result, without modifying the Series itself.
@@ -718,7 +725,7 @@ class SeriesChecks:
     def head(
         self,
         n: int = 5,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
     ) -> pd.Series:
         """Displays the first n rows of a Series, without modifying the Series itself.
@@ -740,7 +747,7 @@ class SeriesChecks:
 
     def hist(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         **kwargs: Any,
     ) -> pd.Series:
@@ -760,13 +767,13 @@ class SeriesChecks:
             Plots are only displayed when code is run in IPython/Jupyter, not in terminal.
         """
         pd.DataFrame(_apply_modifications(self._obj, fn)).check.hist(
-            check_name=check_name, subset=[], **kwargs
+            check_name=check_name, **kwargs
         )
         return self._obj
 
     def info(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "ℹ️ Series info",
         **kwargs: Any,
     ) -> pd.Series:
@@ -790,7 +797,7 @@ class SeriesChecks:
 
     def memory_usage(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "💾 Memory usage",
         **kwargs: Any,
     ) -> pd.Series:
@@ -816,7 +823,7 @@ class SeriesChecks:
 
     def ndups(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         **kwargs: Any,
     ) -> pd.Series:
@@ -839,7 +846,7 @@ class SeriesChecks:
 
     def nnulls(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "👻 Rows with NaNs",
     ) -> pd.Series:
         """Displays the number of rows with null values in the Series, without modifying the Series itself.
@@ -860,7 +867,7 @@ class SeriesChecks:
 
     def nrows(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "☰ Rows",
     ) -> pd.Series:
         """Displays the number of rows in a Series, without modifying the Series itself.
@@ -879,7 +886,7 @@ class SeriesChecks:
 
     def nunique(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         **kwargs: Any,
     ) -> pd.Series:
@@ -900,14 +907,16 @@ class SeriesChecks:
             check_fn=lambda s: s.nunique(**kwargs),
             modify_fn=fn,
             check_name=check_name
-            if check_name
-            else f"🌟 Unique values in {self._obj.name if self._obj.name else 'series'}",
+            or (
+                lambda: f"🌟 Unique values in {self._obj.name if self._obj.name else 'series'}"
+            ),
+            cache_key=("nunique", tuple(sorted(kwargs.items()))),
         )
         return self._obj
 
     def plot(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "",
         **kwargs: Any,
     ) -> pd.Series:
@@ -936,7 +945,7 @@ class SeriesChecks:
     def print(
         self,
         object: Any = None,  # Anything printable: str, int, list, DataFrame, etc
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         max_rows: int = 10,
     ) -> pd.Series:
@@ -1019,7 +1028,7 @@ class SeriesChecks:
 
     def shape(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "📐 Shape",
     ) -> pd.Series:
         """Displays the Series's dimensions, without modifying the Series itself.
@@ -1042,13 +1051,14 @@ class SeriesChecks:
             check_fn=lambda s: s.shape,
             modify_fn=fn,
             check_name=check_name,
+            cache_key="shape",
         )
         return self._obj
 
     def tail(
         self,
         n: int = 5,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
     ) -> pd.Series:
         """Displays the last n rows of the Series, without modifying the Series itself.
@@ -1070,8 +1080,9 @@ class SeriesChecks:
 
     def unique(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
+        max_rows: Union[int, None] = 200,
     ) -> pd.Series:
         """Displays the unique values in a Series, without modifying the Series itself.
 
@@ -1080,23 +1091,28 @@ class SeriesChecks:
         Args:
             fn: An optional lambda function to apply to the Series before running Pandas unique(). Example: `lambda s: s.dropna()`.
             check_name: An optional name for the check, to be printed as preface to the result.
+            max_rows: Maximum number of unique values to show. If None, show all of them. If values are left out, the default check name says so.
 
         Returns:
             The original Series, unchanged.
         """
-        _check_data(
-            self._obj,
-            check_fn=lambda s: s.unique().tolist(),
-            modify_fn=fn,
-            check_name=check_name
-            if check_name
-            else f"🌟 Unique values of {self._obj.name if self._obj.name else 'series'}",
-        )
+        if not get_mode()["enable_checks"]:
+            return self._obj
+        values = pd.unique(_apply_modifications(self._obj, fn))
+        if not check_name:
+            name = self._obj.name if self._obj.name else "series"
+            check_name = (
+                f"🌟 First {max_rows} unique values of {name}"
+                if max_rows is not None and len(values) > max_rows
+                else f"🌟 Unique values of {name}"
+            )
+        # Only convert the values we'll show to a list
+        _display_check(values[:max_rows].tolist(), name=check_name)
         return self._obj
 
     def value_counts(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         max_rows: int = 10,
         check_name: Union[str, None] = None,
         **kwargs: Any,
@@ -1116,13 +1132,16 @@ class SeriesChecks:
         """
         _check_data(
             self._obj,
-            check_fn=lambda s: s.value_counts(**kwargs).head(max_rows),
+            check_fn=lambda s: _downcast_counts(
+                s.value_counts(**kwargs).head(max_rows)
+            ),
             modify_fn=fn,
             check_name=check_name
-            if check_name
-            else f"🧮 Value counts, first {max_rows} values"
-            if max_rows
-            else f"🧮 Value counts",
+            or (
+                lambda: f"🧮 Value counts, first {max_rows} values"
+                if max_rows
+                else f"🧮 Value counts"
+            ),
         )
         return self._obj
 
@@ -1130,7 +1149,7 @@ class SeriesChecks:
         self,
         path: str,
         format: Union[str, None] = None,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         verbose: bool = False,
         **kwargs: Any,
     ) -> pd.Series:
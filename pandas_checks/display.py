@@ -4,10 +4,10 @@
 import base64
 import io
 import textwrap
+from functools import lru_cache
 from typing import Any, Dict, Union
 
 import emoji
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from IPython.display import HTML, Markdown, display
@@ -18,6 +18,23 @@ from termcolor import colored
 # -----------------------
 
 
+# Mirrors the pdchecks.use_emojis option, so we don't look it up each time we display text
+_use_emojis = True
+
+
+def _sync_use_emojis(key: str) -> None:
+    """Updates our copy of the pdchecks.use_emojis option. Called by Pandas whenever the option is set.
+
+    Args:
+        key: The name of the option that was set.
+
+    Returns:
+        None
+    """
+    global _use_emojis
+    _use_emojis = pd.get_option(key)
+
+
 def _filter_emojis(text: str) -> str:
     """Removes emojis from text if user has globally forbidden them.
 
@@ -27,8 +44,23 @@ def _filter_emojis(text: str) -> str:
     Returns:
         The text with emojis removed if the user's global settings do not allow emojis. Else, the original text.
     """
-    if pd.get_option("pdchecks.use_emojis"):
+    if _use_emojis:
         return text
+    return _strip_emojis(text)
+
+
+@lru_cache(maxsize=512)
+def _strip_emojis(text: str) -> str:
+    """Removes emojis from text, caching the result.
+
+    The same check names are displayed over and over, so we only scan each one for emojis once.
+
+    Args:
+        text: The text to remove emojis from.
+
+    Returns:
+        The text without emojis.
+    """
     return emoji.replace_emoji(text, replace="").strip()
 
 
@@ -219,6 +251,9 @@ def _display_plot() -> None:
         It assumes the plot has already been drawn by another function, such as with .plot() or .hist().
     """
     if not pd.core.config_init.is_terminal():
+        # Import here, not at the top of the module, so `import pandas_checks` doesn't load matplotlib unless we plot
+        import matplotlib.pyplot as plt
+
         indent = pd.get_option("pdchecks.indent_table_plot_ipython")  # In pixels
         # Save the figure to a bytes buffer
         buffer = io.BytesIO()
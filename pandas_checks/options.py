@@ -4,21 +4,26 @@ This module provides functions for setting and managing global options for
 Pandas Checks, including formatting and disabling checks and assertions.
 """
 
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Union
 
 import pandas as pd
 import pandas._config.config as cf
 
+from .display import _sync_use_emojis
+
 
 # -----------------------
 # Helpers
 # -----------------------
-def _set_option(option: str, value: Any) -> None:
+def _set_option(
+    option: str, value: Any, valid_options: Union[FrozenSet[str], None] = None
+) -> None:
     """Updates the value of a Pandas Checks option in the global Pandas context manager.
 
     Args:
         option: The name of the option to set.
         value: The value to set for the option.
+        valid_options: Optional, precomputed names of all Pandas Checks options. Pass this when setting several options at once, so we don't re-scan the Pandas options registry for each one.
 
     Returns:
         None
@@ -29,16 +34,31 @@ def _set_option(option: str, value: Any) -> None:
     pdchecks_option = (
         option if option.startswith("pdchecks.") else "pdchecks." + option
     )  # Fully qualified
-    if pdchecks_option in pd._config.config._select_options("pdchecks"):
+    if valid_options is None:
+        valid_options = _pdchecks_options()
+    if pdchecks_option in valid_options:
         pd.set_option(pdchecks_option, value)
     else:
         raise AttributeError(
-            f"No Pandas Checks option for {pdchecks_option}. Available options: {pd._config.config._select_options('pdchecks')}"
+            f"No Pandas Checks option for {pdchecks_option}. Available options: {sorted(valid_options)}"
         )
 
 
+def _pdchecks_options() -> FrozenSet[str]:
+    """Looks up the names of all registered Pandas Checks options.
+
+    Returns:
+        The fully qualified option names, such as "pdchecks.precision".
+    """
+    return frozenset(pd._config.config._select_options("pdchecks"))
+
+
 def _register_option(
-    name: str, default_value: Any, description: str, validator: Callable
+    name: str,
+    default_value: Any,
+    description: str,
+    validator: Callable,
+    callback: Union[Callable, None] = None,
 ) -> None:
     """Registers a Pandas Checks option in the global Pandas context manager.
 
@@ -53,6 +73,7 @@ def _register_option(
         default_value: The default value for the option.
         description: A description of the option.
         validator: A function to validate the option value.
+        callback: Optional function to call with the option's name whenever its value is set.
 
     Returns:
         None
@@ -73,7 +94,11 @@ def _register_option(
     except pd.errors.OptionError:
         with cf.config_prefix("pdchecks"):
             # Register it!
-            cf.register_option(key_name, default_value, description, validator)
+            cf.register_option(
+                key_name, default_value, description, validator, cb=callback
+            )
+        if callback:  # Pandas doesn't call it for the default value
+            callback(f"pdchecks.{key_name}")
 
 
 # -----------------------
@@ -94,8 +119,9 @@ def set_format(**kwargs: Any) -> None:
         **kwargs: Pairs of setting name and its new value.
 
     """
+    valid_options = _pdchecks_options()  # Look up once, not once per kwarg
     for arg, value in kwargs.items():
-        _set_option(arg, value)
+        _set_option(arg, value, valid_options)
 
 
 def reset_format() -> None:
@@ -155,6 +181,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     Whether Pandas Checks `check_names` text should keep emojis. This includes default check_names from the factory and user-supplied check_names`.
     """,
             validator=cf.is_instance_factory(bool),
+            callback=_sync_use_emojis,
         )
     if "indent_table_terminal" in option_keys or options == None:
         _register_option(
@@ -359,5 +386,26 @@ def _initialize_options() -> None:
     """,
         validator=cf.is_instance_factory(bool),
     )
+    _register_option(
+        name="wide_frame_threshold",
+        default_value=10_000,
+        description="""
+    : int
+    Number of columns above which .check.memory_usage() estimates a DataFrame's memory footprint from its dtypes, instead of measuring each column. Does not apply when `deep=True` is passed.
+    """,
+        validator=cf.is_nonnegative_int,
+    )
+    _register_option(
+        name="cache_results",
+        default_value=False,
+        description="""
+    : bool
+    Whether Pandas Checks reuses the result of a check when the same check is run again on the same DataFrame or Series object, such as .check.describe().
+    Only applies to checks without an `fn` argument.
+
+    Changes made to a DataFrame in place, such as df.loc[0, "a"] = 1, are not detected. Leave this False if you modify DataFrames in place between checks.
+    """,
+        validator=cf.is_instance_factory(bool),
+    )
     # Register default format options
     _initialize_format_options()
@@ -1,14 +1,57 @@
 """Utilities for running Pandas Checks data checks."""
 
-from typing import Any, Callable, List, Union
+import weakref
+from typing import Any, Callable, Dict, Hashable, List, Tuple, Union
+
+import pandas as pd
 
 from .display import _display_check
 from .options import get_mode
 
+# Results of earlier checks, by id() of the data object they were run on.
+# Each entry holds a weak reference to that object, so a reused id() is never mistaken for it,
+# and the entry is dropped once the object is garbage collected.
+_RESULT_CACHE: Dict[int, Tuple[weakref.ref, Dict[Hashable, Any]]] = {}
+
+
+def _identity(data: Any) -> Any:
+    """Returns data unchanged. The default `fn` for Pandas Checks methods.
+
+    Args:
+        data: May be any Pandas DataFrame, Series, string, or other variable
+
+    Returns:
+        The same data object.
+    """
+    return data
+
+
+def _select_subset(data: Any, subset: Union[str, List, None] = None) -> Any:
+    """Selects a subset of columns from a data object.
+
+    Args:
+        data: May be any Pandas DataFrame, Series, string, or other variable
+        subset: Columns to select. If None or empty, data is returned unchanged.
+
+    Returns:
+        The subsetted data object. If `subset` is every column of a DataFrame in order, the DataFrame itself, to skip copying it.
+    """
+    if not subset:
+        return data
+    if (
+        isinstance(data, pd.DataFrame)
+        and isinstance(subset, list)
+        and len(subset) == data.shape[1]
+        and data.columns.is_unique
+        and subset == data.columns.tolist()
+    ):
+        return data
+    return data[subset]
+
 
 def _apply_modifications(
     data: Any,
-    fn: Callable = lambda df: df,
+    fn: Callable = _identity,
     subset: Union[str, List, None] = None,
 ) -> Any:
     """Applies user's modifications to a data object.
@@ -25,15 +68,93 @@ def _apply_modifications(
         raise TypeError(
             f"Expected lambda function for argument `fn` (callable type), but received type {type(fn)}"
         )
-    return fn(data)[subset] if subset else fn(data)
+    if fn is _identity:  # Skip calling the default fn
+        return _select_subset(data, subset)
+    return _select_subset(fn(data), subset)
+
+
+def _cached_results(data: Any) -> Union[Dict[Hashable, Any], None]:
+    """Gets the cached check results for a data object, starting an empty cache if there isn't one.
+
+    Args:
+        data: A Pandas DataFrame, Series, or other variable
+
+    Returns:
+        A dictionary of check results for `data`, or None if `data` can't be cached, such as a string.
+    """
+    data_id = id(data)
+    entry = _RESULT_CACHE.get(data_id)
+    if entry is not None and entry[0]() is data:
+        return entry[1]
+
+    def _forget(ref: weakref.ref) -> None:
+        if _RESULT_CACHE.get(data_id, (None,))[0] is ref:
+            del _RESULT_CACHE[data_id]
+
+    try:
+        ref = weakref.ref(data, _forget)
+    except TypeError:  # Type doesn't support weak references
+        return None
+    results: Dict[Hashable, Any] = {}
+    _RESULT_CACHE[data_id] = (ref, results)
+    return results
+
+
+def _run_check(
+    data: Any,
+    check_fn: Callable = _identity,
+    modify_fn: Callable = _identity,
+    subset: Union[str, List, None] = None,
+    cache_key: Union[Hashable, None] = None,
+) -> Any:
+    """Applies user's modifications to a data object, then the check. Reuses an earlier result if result caching is on.
+
+    Results are only cached when the check passes a `cache_key` and there's no `modify_fn`, since a user's lambda function is a new object on every call.
+
+    Args:
+        data: A Pandas DataFrame, Series, string, or other variable
+        check_fn: Function to apply to data for checking
+        modify_fn: Optional function to modify data _before_ checking
+        subset: Optional list of columns or name of column to subset data before running check_fn
+        cache_key: Optional, identifies the check and its arguments, such as ("describe", (("include", "all"),))
+
+    Returns:
+        The result of the check.
+    """
+    results = None
+    if (
+        cache_key is not None
+        and modify_fn is _identity
+        and pd.get_option("pdchecks.cache_results")
+    ):
+        key = (
+            cache_key,
+            tuple(subset) if isinstance(subset, list) else subset,
+            getattr(data, "shape", None),  # Catch added or dropped rows and columns
+        )
+        try:
+            hash(key)
+            results = _cached_results(data)
+        except TypeError:  # Unhashable arguments, like a list passed in kwargs
+            pass
+        if results is not None and key in results:
+            return results[key]
+
+    # 1. Apply user's modifications to the data before checking it.
+    # 2. Then apply the method's operation to the data, like value_counts() or dtypes. May return a DF, an int, etc
+    result = check_fn(_apply_modifications(data, fn=modify_fn, subset=subset))
+    if results is not None:
+        results[key] = result
+    return result
 
 
 def _check_data(
     data: Any,
-    check_fn: Callable = lambda df: df,
-    modify_fn: Callable = lambda df: df,
+    check_fn: Callable = _identity,
+    modify_fn: Callable = _identity,
     subset: Union[str, List, None] = None,
-    check_name: Union[str, None] = None,
+    check_name: Union[str, Callable[[], str], None] = None,
+    cache_key: Union[Hashable, None] = None,
 ) -> None:
     """Runs a selected check on a data object
 
@@ -42,22 +163,17 @@ def _check_data(
         check_fn: Function to apply to data for checking. For example if we're running .check.value_counts(), this function would appply the Pandas value_counts() method
         modify_fn: Optional function to modify data _before_ checking
         subset: Optional list of columns or name of column to subset data before running check_fn
-        check_name: Name to use when displaying check result
+        check_name: Name to use when displaying check result. May be a function that returns the name, so it's only built if the result is displayed.
+        cache_key: Optional, identifies the check and its arguments, so its result can be reused when the `pdchecks.cache_results` option is on
 
     Returns:
         None
     """
     if get_mode()["enable_checks"]:
-        (
-            # 3. Report the result
-            _display_check(
-                # 2. After applying the method's operation to the data,
-                # like value_counts() or dtypes. May return a DF, an int, etc
-                check_fn(
-                    # 1. After first applying user's modifications to the data
-                    # before checking it.
-                    _apply_modifications(data, fn=modify_fn, subset=subset)
-                ),
-                name=check_name if check_name else str(subset) if subset else None,
-            )
+        if callable(check_name):
+            check_name = check_name()
+        # Report the result
+        _display_check(
+            _run_check(data, check_fn, modify_fn, subset, cache_key),
+            name=check_name if check_name else str(subset) if subset else None,
         )
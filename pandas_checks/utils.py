@@ -2,9 +2,12 @@
 Utility functions for the pandas_checks package.
 """
 from datetime import datetime, timedelta
-from inspect import getsourcelines
-from typing import Any, Callable, Type, Union
+from functools import lru_cache
+from inspect import getsourcelines, unwrap
+from types import CodeType
+from typing import Any, Callable, Dict, Type, Union
 
+import numpy as np
 import pandas as pd
 from pandas.core.groupby.groupby import DataError
 
@@ -25,7 +28,30 @@ def _lambda_to_string(lambda_func: Callable) -> str:
             They get entangled with the argument when it's a lambda function.
             Try other ways to get just the argument we want.
     """
-    return "".join(getsourcelines(lambda_func)[0]).lstrip(" .")
+    lambda_func = unwrap(
+        lambda_func
+    )  # Show the user's function, not a decorator's wrapper
+    code = getattr(lambda_func, "__code__", None)
+    if code is None:  # Not a plain function, like a callable class instance
+        return "".join(getsourcelines(lambda_func)[0]).lstrip(" .")
+    return _code_to_string(code.co_filename, code.co_firstlineno, code)
+
+
+@lru_cache(maxsize=256)
+def _code_to_string(filename: str, first_line: int, code: CodeType) -> str:
+    """Looks up the source of a compiled function, caching the result.
+
+    getsourcelines() re-reads and re-tokenizes the source file on every call, which gets expensive when an assertion runs in a loop.
+
+    Args:
+        filename: The file the function was defined in. Part of the cache key, since code objects that only differ by file compare equal.
+        first_line: The line the function starts on. Part of the cache key.
+        code: The __code__ object of a function
+
+    Returns:
+        A string version of the function's source
+    """
+    return "".join(getsourcelines(code)[0]).lstrip(" .")
 
 
 def _has_nulls(
@@ -63,6 +89,115 @@ def _has_nulls(
     return has_nulls
 
 
+def _count_rows_with_nulls(data: pd.DataFrame, block_size: int = 1024) -> int:
+    """Utility function to count rows that have a null in any column.
+
+    Builds up one boolean row mask from blocks of columns, rather than materializing a null mask the size of the whole DataFrame.
+
+    Args:
+        data: The DataFrame to count rows with nulls in
+        block_size: Number of columns to check for nulls at a time
+
+    Returns:
+        The number of rows with at least one null
+    """
+    mask = np.zeros(len(data), dtype=bool)
+    for i in range(0, data.shape[1], block_size):
+        np.logical_or(
+            mask,
+            data.iloc[:, i : i + block_size].isna().to_numpy().any(axis=1),
+            out=mask,
+        )
+    return int(mask.sum())
+
+
+def _downcast_counts(counts: pd.Series) -> pd.Series:
+    """Utility function to store integer counts, like from Pandas value_counts(), in the smallest unsigned integer type that fits them.
+
+    Non-integer results, such as from `normalize=True`, are returned unchanged.
+
+    Args:
+        counts: The counts to downcast
+
+    Returns:
+        The counts, downcast if they're integers
+    """
+    if pd.api.types.is_integer_dtype(counts.dtype):
+        return pd.to_numeric(counts, downcast="unsigned")
+    return counts
+
+
+def _estimate_memory_usage(data: pd.DataFrame, index: bool = True) -> pd.Series:
+    """Utility function to estimate the memory footprint of a wide DataFrame from its dtypes.
+
+    Counts the columns of each dtype once, rather than building a result for every column like Pandas memory_usage().
+    Matches the shallow (`deep=False`) memory_usage() for NumPy dtypes. Other dtypes, like category, are counted as 8 bytes per value.
+
+    Args:
+        data: The DataFrame to estimate memory usage for
+        index: Whether to include the memory usage of the DataFrame's index
+
+    Returns:
+        Estimated bytes by dtype, plus the index if `index` is True
+    """
+    # Sum by dtype name, since distinct dtypes can share a name, like two categoricals with different categories
+    bytes_by_dtype: Dict[str, int] = {}
+    for dtype, n_columns in data.dtypes.value_counts().items():
+        bytes_by_dtype[str(dtype)] = bytes_by_dtype.get(str(dtype), 0) + getattr(
+            dtype, "itemsize", 8
+        ) * n_columns * len(data)
+    estimate = pd.Series(bytes_by_dtype, dtype="int64")
+    if index:
+        estimate = pd.concat(
+            [pd.Series({"Index": data.index.memory_usage()}, dtype="int64"), estimate]
+        )
+    return estimate
+
+
+def _hashes_like_duplicated(s: pd.Series) -> bool:
+    """Utility function to check whether hashing a series' values finds the same duplicates as Pandas duplicated(), and is worth doing.
+
+    Only integer, bool, and datetime columns qualify. Hashing tells apart float values that duplicated() treats as equal, such as 0.0 and -0.0, and it is slower than duplicated() for strings.
+
+    Args:
+        s: The column to check
+
+    Returns:
+        Whether the column can be hashed to look for duplicate rows
+    """
+    dtype = s.dtype
+    return (
+        pd.api.types.is_integer_dtype(dtype)
+        or pd.api.types.is_bool_dtype(dtype)
+        or pd.api.types.is_datetime64_any_dtype(dtype)
+    )
+
+
+def _count_duplicates(data: Union[pd.DataFrame, pd.Series], **kwargs: Any) -> int:
+    """Utility function to count duplicated rows, like Pandas `duplicated(**kwargs).sum()`.
+
+    For DataFrames whose columns are all integer, bool, or datetime, hashes each row to a single uint64 and looks for duplicates in that one array, which gives the same count as duplicated().
+    Otherwise, such as for a single column, a Series, or any keyword besides `keep`, calls Pandas duplicated() directly.
+
+    Args:
+        data: The DataFrame or Series to count duplicates in
+        **kwargs: Arguments accepted by Pandas duplicated(), such as `keep`
+
+    Returns:
+        The number of duplicated rows
+    """
+    keep = kwargs.get("keep", "first")
+    if set(kwargs) - {"keep"} or isinstance(data, pd.Series):
+        return int(data.duplicated(**kwargs).sum())
+    if data.shape[1] < 2 or not all(
+        _hashes_like_duplicated(data.iloc[:, i]) for i in range(data.shape[1])
+    ):
+        return int(data.duplicated(keep=keep).sum())
+    return int(
+        pd.util.hash_pandas_object(data, index=False).duplicated(keep=keep).sum()
+    )
+
+
 def _series_is_type(s: pd.Series, dtype: Type[Any]) -> bool:
     """Utility function to check if a series has an expected type.
     Includes special handling for strings, since 'object' type in Pandas
@@ -233,6 +233,10 @@ def method_shape():
     return lambda df, _: df.check.shape(fn=lambda df: df.dropna(), check_name="Test")
 
 
+def method_summary():
+    return lambda df, _: df.check.summary(fn=lambda df: df.dropna(), check_name="Test")
+
+
 def method_tail():
     return lambda df, _: df.check.tail(
         n=20, fn=lambda df: df.dropna(), check_name="Test"
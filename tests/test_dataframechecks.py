@@ -4,7 +4,13 @@ import pytest
 from pandas.core.groupby.groupby import DataError
 from pytest_cases import parametrize_with_cases
 
-from pandas_checks import disable_checks, enable_checks, reset_format, start_timer
+from pandas_checks import (
+    disable_checks,
+    enable_checks,
+    reset_format,
+    set_format,
+    start_timer,
+)
 
 
 # Helper function
@@ -145,6 +151,22 @@ def test_DataFrameChecks_memory_usage(iris, capsys):
     )
 
 
+def test_DataFrameChecks_memory_usage_wide_frame(iris, capsys):
+    set_format(wide_frame_threshold=1)
+    iris.check.memory_usage(
+        fn=lambda df: df[["petal_width", "sepal_width", "species"]].dropna(),
+        check_name="Test",
+        index=False,
+    )
+    assert (
+        capsys.readouterr().out
+        == """\nTest
+    float64    2400
+    object     1200\n"""
+    )
+    pd.reset_option("pdchecks.wide_frame_threshold")
+
+
 def test_DataFrameChecks_ncols(iris, capsys):
     iris.check.ncols(
         fn=lambda df: df.assign(C=55), check_name="Test", subset=["C", "species"]
@@ -311,6 +333,36 @@ def test_DataFrameChecks_shape(iris, capsys):
     assert capsys.readouterr().out == "\nTest: (150, 2)\n"
 
 
+def test_DataFrameChecks_summary(iris, capsys):
+    iris.check.summary(
+        fn=lambda df: df.assign(C=55), check_name="Test", subset=["C", "species"]
+    )
+    assert (
+        capsys.readouterr().out
+        == """\nTest
+    (150, 2)   dtype  memory_usage
+    C          int64          1200
+    species   object          1200\n"""
+    )
+
+
+def test_DataFrameChecks_summary_cached(iris, capsys, monkeypatch):
+    pd.set_option("pdchecks.cache_results", True)
+    iris.check.summary(check_name="Test")
+    first = capsys.readouterr().out
+    calls = []
+    memory_usage = pd.DataFrame.memory_usage
+    monkeypatch.setattr(
+        pd.DataFrame,
+        "memory_usage",
+        lambda *args, **kwargs: calls.append(1) or memory_usage(*args, **kwargs),
+    )
+    iris.check.summary(check_name="Test")
+    pd.set_option("pdchecks.cache_results", False)  # Reset
+    assert calls == []
+    assert capsys.readouterr().out == first
+
+
 def test_DataFrameChecks_tail(iris, capsys):
     iris.check.tail(n=1, fn=lambda df: (df * 2), check_name="Test")
     assert (
@@ -389,3 +441,19 @@ def test_DataFrameChecks_write(iris, format_extension, tmp_path, capsys):
         assert_equal_df(f(iris), pd.read_pickle(path))
     elif extension == "tsv":
         assert_equal_df(f(iris), pd.read_csv(path, sep="\t", index_col=0))
+
+
+def test_DataFrameChecks_write_format(iris, tmp_path):
+    path = f"{tmp_path}/test.txt"
+    iris.check.write(path=path, format="csv")
+    assert_equal_df(iris, pd.read_csv(path, index_col=0))
+
+
+def test_DataFrameChecks_write_unknown_extension(iris, tmp_path):
+    with pytest.raises(AttributeError):
+        iris.check.write(path=f"{tmp_path}/test.txt")
+
+
+def test_DataFrameChecks_write_unknown_format(iris, tmp_path):
+    with pytest.raises(AttributeError, match="Unknown format: foo"):
+        iris.check.write(path=f"{tmp_path}/test.csv", format="foo")
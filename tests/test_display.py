@@ -1,3 +1,4 @@
+import pandas as pd
 import pytest
 
 import pandas_checks as pdc
@@ -20,6 +21,13 @@ def test_filter_emojis():
     pdc.set_format(use_emojis=True)  # Reset for later tests
 
 
+def test_filter_emojis_option_context():
+    original = "Hello 🐼"
+    with pd.option_context("pdchecks.use_emojis", False):
+        assert _filter_emojis(original) == "Hello"
+    assert _filter_emojis(original) == original
+
+
 @pytest.mark.parametrize(
     "color, expected",
     [
@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 from pandas_checks import options
 
@@ -55,3 +56,16 @@ def test_register_option_existing():
     options._set_option("precision", 17)
     options._register_option("precision", 10, "", lambda x: isinstance(x, int))
     assert pd.get_option("pdchecks.precision") == 10
+
+
+def test_set_format_invalid_option():
+    with pytest.raises(AttributeError):
+        options.set_format(precision=3, not_an_option=True)
+    options.reset_format()
+
+
+def test_reset_format_keeps_wide_frame_threshold():
+    options.set_format(wide_frame_threshold=5)
+    options.reset_format()
+    assert pd.get_option("pdchecks.wide_frame_threshold") == 5
+    pd.reset_option("pdchecks.wide_frame_threshold")
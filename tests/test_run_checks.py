@@ -2,7 +2,12 @@ import pandas as pd
 import pytest
 
 import pandas_checks as pdc
-from pandas_checks.run_checks import _apply_modifications, _check_data
+from pandas_checks.run_checks import (
+    _apply_modifications,
+    _check_data,
+    _identity,
+    _select_subset,
+)
 
 
 def test_apply_modifications_lambda():
@@ -30,6 +35,18 @@ def test_apply_modifications_subset():
     pd.testing.assert_frame_equal(result, expected)
 
 
+def test_apply_modifications_identity():
+    df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+    assert _apply_modifications(df, _identity) is df
+    pd.testing.assert_series_equal(_apply_modifications(df, _identity, "A"), df["A"])
+
+
+def test_select_subset_all_columns():
+    df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+    assert _select_subset(df, ["A", "B"]) is df
+    pd.testing.assert_frame_equal(_select_subset(df, ["B", "A"]), df[["B", "A"]])
+
+
 def test_apply_modifications_invalid_fn():
     df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
     fn = 123
@@ -58,3 +75,37 @@ def test_check_data_disable_checks(capsys):
     _check_data(df, check_fn, modify_fn, subset, check_name)
     assert capsys.readouterr().out == ""
     pdc.enable_checks()  # Reset
+
+
+def test_check_data_cache_results(capsys):
+    df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+    calls = []
+    check_fn = lambda x: calls.append(1) or x.shape
+    pd.set_option("pdchecks.cache_results", True)
+    _check_data(df, check_fn, check_name="Test", cache_key="test")
+    _check_data(df, check_fn, check_name="Test", cache_key="test")
+    assert len(calls) == 1
+    _check_data(df, check_fn, check_name="Test", cache_key="other")
+    assert len(calls) == 2
+    assert capsys.readouterr().out == "\nTest: (3, 2)\n" * 3
+    pd.set_option("pdchecks.cache_results", False)  # Reset
+
+
+def test_check_data_cache_results_disabled():
+    df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+    calls = []
+    check_fn = lambda x: calls.append(1) or x.shape
+    _check_data(df, check_fn, check_name="Test", cache_key="test")
+    _check_data(df, check_fn, check_name="Test", cache_key="test")
+    assert len(calls) == 2
+
+
+def test_check_data_callable_check_name(capsys):
+    df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+    _check_data(df, lambda x: x.shape, check_name=lambda: "Test Check")
+    assert capsys.readouterr().out == "\nTest Check: (3, 2)\n"
+    pdc.disable_checks()
+    calls = []
+    _check_data(df, lambda x: x.shape, check_name=lambda: calls.append(1) or "Test")
+    assert calls == []
+    pdc.enable_checks()  # Reset
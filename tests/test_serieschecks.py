@@ -319,6 +319,24 @@ def test_SeriesChecks_unique(iris, capsys):
     )
 
 
+def test_SeriesChecks_unique_max_rows(iris, capsys):
+    iris["species"].check.unique(check_name="Test", max_rows=2)
+    assert capsys.readouterr().out == "\nTest: ['setosa', 'versicolor']\n"
+
+
+def test_SeriesChecks_unique_truncated_check_name(iris, capsys):
+    iris["species"].check.unique(max_rows=2)
+    assert (
+        capsys.readouterr().out
+        == "\n🌟 First 2 unique values of species: ['setosa', 'versicolor']\n"
+    )
+    iris["species"].check.unique(max_rows=3)
+    assert (
+        capsys.readouterr().out
+        == "\n🌟 Unique values of species: ['setosa', 'versicolor', 'virginica']\n"
+    )
+
+
 def test_SeriesChecks_value_counts(iris, capsys):
     """Test that kwargs are getting passed to Pandas's value_counts()"""
     iris["species"].check.value_counts(
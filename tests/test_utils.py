@@ -0,0 +1,132 @@
+import functools
+import importlib.util
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_checks.utils import (
+    _count_duplicates,
+    _count_rows_with_nulls,
+    _downcast_counts,
+    _estimate_memory_usage,
+    _lambda_to_string,
+)
+
+
+def _load_module(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_lambda_to_string_same_line_different_files(tmp_path):
+    (tmp_path / "module_a.py").write_text(
+        "condition = lambda df: df.shape[0] > 5  # A\n"
+    )
+    (tmp_path / "module_b.py").write_text(
+        "condition = lambda df: df.shape[0] > 5  # B\n"
+    )
+    module_a = _load_module(tmp_path / "module_a.py", "module_a")
+    module_b = _load_module(tmp_path / "module_b.py", "module_b")
+    assert _lambda_to_string(module_a.condition).endswith("# A\n")
+    assert _lambda_to_string(module_b.condition).endswith("# B\n")
+
+
+def _decorator(f):
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        return f(*args, **kwargs)
+
+    return wrapper
+
+
+@_decorator
+def _has_rows(df):
+    return df.shape[0] > 0
+
+
+def test_lambda_to_string_decorated():
+    assert _lambda_to_string(_has_rows).startswith("@_decorator\ndef _has_rows(df):")
+
+
+def test_count_rows_with_nulls_no_columns():
+    assert _count_rows_with_nulls(pd.DataFrame(index=range(3))) == 0
+
+
+def test_count_rows_with_nulls_mixed_dtypes():
+    df = pd.DataFrame(
+        {
+            "a": [1.0, np.nan, 3.0, 4.0],
+            "b": ["x", "y", None, "z"],
+            "c": pd.to_datetime(["2024-01-01", None, "2024-01-03", "2024-01-04"]),
+            "d": [1, 2, 3, 4],
+        }
+    )
+    assert _count_rows_with_nulls(df) == 2
+    assert _count_rows_with_nulls(df, block_size=1) == 2
+
+
+def _duplicates_frame():
+    return pd.DataFrame(
+        {
+            "a": [1, 1, 2, 2, 3],
+            "b": [True, True, False, True, False],
+            "c": pd.to_datetime(["2024-01-01"] * 4 + ["2024-01-02"]),
+            "d": pd.Categorical(["x", "x", "y", "y", "x"]),
+            "e": [0.0, -0.0, 1.0, 1.0, np.nan],
+        }
+    )
+
+
+@pytest.mark.parametrize("keep", ["first", "last", False])
+@pytest.mark.parametrize(
+    "columns",
+    [["a", "b", "c"], ["a", "d"], ["a", "e"], ["e"]],
+    ids=["hashed", "int_categorical", "float_fallback", "single_column"],
+)
+def test_count_duplicates(columns, keep):
+    df = _duplicates_frame()[columns]
+    assert _count_duplicates(df, keep=keep) == df.duplicated(keep=keep).sum()
+
+
+@pytest.mark.parametrize("subset", ["a", ["a", "b"], ["a", "e"]])
+def test_count_duplicates_other_kwargs(subset):
+    df = _duplicates_frame()
+    assert _count_duplicates(df, subset=subset, keep=False) == int(
+        df.duplicated(subset=subset, keep=False).sum()
+    )
+
+
+def test_count_duplicates_series():
+    assert _count_duplicates(_duplicates_frame()["e"], keep=False) == 4
+
+
+def test_estimate_memory_usage_same_dtype_name():
+    df = pd.DataFrame(
+        {
+            "a": pd.Categorical(["x", "y"]),
+            "b": pd.Categorical(["p", "q"]),
+            "c": [1, 2],
+        }
+    )
+    pd.testing.assert_series_equal(
+        _estimate_memory_usage(df, index=False),
+        pd.Series({"category": 32, "int64": 16}, dtype="int64"),
+        check_like=True,
+    )
+
+
+def test_downcast_counts_integers():
+    counts = pd.Series(["a", "a", "b"]).value_counts()
+    result = _downcast_counts(counts)
+    assert result.dtype == "uint8"
+    assert result.tolist() == counts.tolist()
+
+
+def test_downcast_counts_normalized():
+    counts = pd.Series(["a"]).value_counts(normalize=True)
+    result = _downcast_counts(counts)
+    assert result.dtype == "float64"
+    assert result.tolist() == [1.0]